@@ -7,8 +7,10 @@ brute-force key recovery using χ² and ETAOIN heuristics.
 
 Public API:
 - Types: Meta, Message
-- Core: encode_caesar_cipher, decode_caesar_cipher, decode_if_able,
-        read_received_messages, brute_force_offset
+- Core: encode_caesar_cipher, decode_caesar_cipher, decode_caesar_cipher_bytes,
+        try_decode, iter_received_messages, read_received_messages,
+        brute_force_offset
+- Helpers: shift, is_int_but_not_bool
 - Constants: ALPHABET, ETAOIN, FILEPATH
 """
 
@@ -22,10 +24,15 @@ from .core import (
     Message,
     # Core functions (public)
     decode_caesar_cipher,
+    decode_caesar_cipher_bytes,
     encode_caesar_cipher,
+    iter_received_messages,
     read_received_messages,
     brute_force_offset,
     try_decode,
+    # Helpers (public)
+    shift,
+    is_int_but_not_bool,
 )  # noqa: F401
 
 __all__ = [
@@ -38,8 +45,13 @@ __all__ = [
     "Message",
     # Core
     "decode_caesar_cipher",
+    "decode_caesar_cipher_bytes",
     "encode_caesar_cipher",
+    "iter_received_messages",
     "read_received_messages",
     "brute_force_offset",
     "try_decode",
+    # Helpers
+    "shift",
+    "is_int_but_not_bool",
 ]
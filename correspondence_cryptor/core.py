@@ -42,19 +42,25 @@ Notes
   due to sample-size effects.
 """
 
+import functools
 import heapq
 import json
 import math
+import operator
+import os
 import re
 import string
 import textwrap
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
 from importlib import resources
 from typing import (
     Any,
+    Callable,
     Final,
     Iterable,
+    Iterator,
     Literal,
     Mapping,
     Optional,
@@ -101,31 +107,62 @@ class DecryptionResult:
 # --- Constants ---
 FILEPATH: Final[str] = "correspondence_cryptor.resources"
 ALPHABET: Final[str] = string.ascii_uppercase
+# translate tables shifting ASCII letters right by k, for every key k in 0..25;
+# there are only 26 Caesar keys, so all of them are built once at import
+_SHIFTED: Final[tuple[str, ...]] = tuple(ALPHABET[k:] + ALPHABET[:k] for k in range(26))
+_STR_TABLES: Final[tuple[dict[int, int], ...]] = tuple(
+    str.maketrans(ALPHABET + ALPHABET.lower(), s + s.lower()) for s in _SHIFTED
+)
+_BYTE_TABLES: Final[tuple[bytes, ...]] = tuple(
+    bytes.maketrans(
+        (ALPHABET + ALPHABET.lower()).encode("ascii"), (s + s.lower()).encode("ascii")
+    )
+    for s in _SHIFTED
+)
+# per-character lookup for the first 128 code points, for `shift()`
+_CHAR_LUTS: Final[tuple[tuple[str, ...], ...]] = tuple(
+    tuple(map(chr, table[:128])) for table in _BYTE_TABLES
+)
 ETAOIN: Final[tuple[str, ...]] = ("E", "T", "A", "O", "I", "N")
 VOWELS: Final[tuple[str, ...]] = ("A", "E", "I", "O", "U")
-KEYWORDS: Final[set[str]] = {
-    "the",
-    "and",
-    "of",
-    "to",
-    "in",
-    "is",
-    "it",
-    "that",
-    "for",
-    "you",
-    "with",
-    "on",
-    "was",
-    "as",
-    "I".lower(),  # lowercase for data normalization
-    "be",
-    "this",
-    "are",
-}
+KEYWORDS: Final[frozenset[str]] = frozenset(
+    {
+        "the",
+        "and",
+        "of",
+        "to",
+        "in",
+        "is",
+        "it",
+        "that",
+        "for",
+        "you",
+        "with",
+        "on",
+        "was",
+        "as",
+        "I".lower(),  # lowercase for data normalization
+        "be",
+        "this",
+        "are",
+    }
+)
 ZERO: Final[Decimal] = Decimal("0")
+# word tokens scored by the keyword-hit heuristic
+_TOKEN_RE: Final[re.Pattern[str]] = re.compile(r"[A-Za-z']+")
+# lower-cases ASCII letters only; Unicode lower() can create or split ASCII tokens
+_ASCII_LOWER: Final[dict[int, int]] = str.maketrans(ALPHABET, ALPHABET.lower())
+# shift-invariant signature (each letter's offset from the first) → keywords;
+# a token decodes to keyword w under exactly one key iff their signatures match
+_KEYWORD_SIGNATURES: Final[dict[tuple[int, ...], tuple[str, ...]]] = {}
+for _kw in sorted(KEYWORDS):
+    _sig = tuple((ord(c) - ord(_kw[0])) % 26 for c in _kw)
+    _KEYWORD_SIGNATURES[_sig] = _KEYWORD_SIGNATURES.get(_sig, ()) + (_kw,)
+del _kw, _sig
+_MAX_KEYWORD_LEN: Final[int] = max(len(kw) for kw in KEYWORDS)
 CENTER: Final[float] = 0.41  # expected vowel ratio in English
 SIGMA: Final[float] = 0.06  # standard deviation for Gaussian
+_TWO_SIGMA_SQ: Final[float] = 2 * SIGMA**2
 K: Final[float] = 4.0  # saturation factor
 BONUS: Final[float] = 0.05  # diversity bonus
 CERTAINTY = ConfidenceLevel()
@@ -177,6 +214,34 @@ assert abs(_total_prop - Decimal("1.0")) < Decimal(
     "0.005"
 ), f"ENGLISH_FREQ_PROPS sums to {_total_prop}, expected ≈ 1.0"
 del _total_prop
+# (letter, proportion) pairs `calc_chi_squared()` scores; zero-expectation letters
+# would divide by zero, so they are dropped here instead of tested per call
+_ENGLISH_FREQ_ITEMS: Final[tuple[tuple[str, Decimal], ...]] = tuple(
+    (ltr, ENGLISH_FREQ_PROPS[ltr]) for ltr in ALPHABET if ENGLISH_FREQ_PROPS[ltr] > ZERO
+)
+
+# float copies of ENGLISH_FREQ_PROPS in ALPHABET order for the brute-force hot path
+_ENGLISH_FREQ_VEC: Final[tuple[float, ...]] = tuple(
+    float(ENGLISH_FREQ_PROPS[ltr]) for ltr in ALPHABET
+)
+# row k, column i: 1/p of the plaintext letter (i + k) % 26 that cipher letter i
+# decodes to under key k, so row k · (cipher counts²) is key k's Σ O²/p
+_ENGLISH_FREQ_INV_ROWS: Final[tuple[tuple[float, ...], ...]] = tuple(
+    tuple(1.0 / _ENGLISH_FREQ_VEC[(i + k) % 26] for i in range(26)) for k in range(26)
+)
+_ENGLISH_FREQ_SUM: Final[float] = math.fsum(_ENGLISH_FREQ_VEC)
+# ALPHABET positions of the ETAOIN letters and of the vowels
+_ETAOIN_IDX: Final[tuple[int, ...]] = tuple(ALPHABET.index(ltr) for ltr in ETAOIN)
+_VOWEL_IDX: Final[tuple[int, ...]] = tuple(ALPHABET.index(ltr) for ltr in VOWELS)
+# per key k: picks, from a cipher histogram, the counts of the cipher letters that
+# decode to ETAOIN / vowels (plaintext letter i came from cipher letter (i − k) % 26)
+_LetterPicker = Callable[[Sequence[int]], tuple[int, ...]]
+_ETAOIN_PICKERS: Final[tuple[_LetterPicker, ...]] = tuple(
+    operator.itemgetter(*((i - k) % 26 for i in _ETAOIN_IDX)) for k in range(26)
+)
+_VOWEL_PICKERS: Final[tuple[_LetterPicker, ...]] = tuple(
+    operator.itemgetter(*((i - k) % 26 for i in _VOWEL_IDX)) for k in range(26)
+)
 
 # blended-score weights
 # tie-break weights for internal use only; not part of public API
@@ -189,6 +254,15 @@ _KEYWORD_WEIGHT: Final[float] = 0.30
 _total_weight = _ETAOIN_WEIGHT + _VOWEL_WEIGHT + _KEYWORD_WEIGHT
 assert abs(_total_weight - 1.0) < 1e-9
 
+# Serial brute force runs at ~0.5 µs per ciphertext character, while a process
+# pool costs ~10 ms start-up per worker plus pickling; measured, the pool lost at
+# every mailbox tried (8 msgs 1.4 vs 8.0 ms, 64 msgs 9.9 vs 18.1 ms, 512 msgs
+# 85.6 vs 103.5 ms). Fan out only once the batch is ~0.5 s of serial work.
+_PARALLEL_MIN_CHARS: Final[int] = 1_000_000
+
+# shared by the CLI demo; same settings as `textwrap.fill(body, width=72)`
+_WRAPPER: Final[textwrap.TextWrapper] = textwrap.TextWrapper(width=72)
+
 
 # --- Typed Schemas ---
 class Meta(TypedDict, total=False):
@@ -213,33 +287,68 @@ def calc_chi_squared(observed: Mapping[str, Decimal], N: Decimal) -> Decimal:
     if N == ZERO or not observed:
         return ZERO
 
-    E = ENGLISH_FREQ_PROPS
     chi2: Decimal = ZERO
-    factor: Decimal = Decimal("1")
-    sum_expected = sum(E.values())
 
-    if sum_expected <= Decimal("1.01"):  # proportions (≈1.0)
-        factor = N
-    elif Decimal("99.0") <= sum_expected <= Decimal("101.0"):  # percents (≈100)
-        factor = N / Decimal("100")
-    else:  # pragma: no cover
-        raise ValueError(f"Unexpected expected-frequency table scale: {sum_expected}")
-
-    if sum(observed.values(), ZERO) != N:
+    # Caller-side invariant; checked only in debug runs (`python -O` skips it).
+    if __debug__ and sum(observed.values(), ZERO) != N:
         raise ValueError("Observed total does not equal N")
 
-    # χ2=∑(O−E)²/E
-    for ch in ALPHABET:
-        upper = ch.upper()
-        expected_count: Decimal = E[upper] * factor
-        observed_count: Decimal = observed.get(upper, ZERO)
-
-        if expected_count > ZERO:
-            chi2 += ((observed_count - expected_count) ** 2) / expected_count
+    # χ2=∑(O−E)²/E; the table is validated as proportions at import, so E = p·N
+    for ch, p in _ENGLISH_FREQ_ITEMS:
+        expected_count: Decimal = p * N
+        observed_count: Decimal = observed.get(ch, ZERO)
+        chi2 += ((observed_count - expected_count) ** 2) / expected_count
 
     return chi2.quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP)
 
 
+def _chi_squared_all_shifts(counts: Sequence[float], N: float) -> list[float]:
+    """Float χ² against English for all 26 rotations of a ciphertext histogram.
+
+    `counts` is the 26-slot ciphertext histogram (ALPHABET order); entry k of
+    the result scores the candidate decoded with key k. Ranking-only twin of
+    `calc_chi_squared()`: no Decimal, no validation.
+
+    Uses Σ(O−E)²/E = ΣO²/E − 2N + ΣE, so squaring happens once and the 26
+    scores are one product of the fixed (26, 26) 1/p matrix with the squares.
+    """
+    squares = [c * c for c in counts]
+    const = N * (_ENGLISH_FREQ_SUM - 2.0)
+    return [
+        sum(map(operator.mul, squares, row)) / N + const
+        for row in _ENGLISH_FREQ_INV_ROWS
+    ]
+
+
+def _chi_squared_per_key(hists: Sequence[Sequence[int]], N: float) -> list[float]:
+    """`_chi_squared_all_shifts()` with a separate ciphertext histogram per key.
+
+    `hists[k]` is laid out like the `counts` argument there, for key k alone
+    (see `_key_histograms()`).
+    """
+    const = N * (_ENGLISH_FREQ_SUM - 2.0)
+    return [
+        sum(c * c * m for c, m in zip(h, row)) / N + const
+        for h, row in zip(hists, _ENGLISH_FREQ_INV_ROWS)
+    ]
+
+
+def _letter_share_all_shifts(
+    counts: Sequence[int], pickers: Sequence[_LetterPicker], N: int
+) -> list[float]:
+    """Share of a letter group (e.g. `_ETAOIN_PICKERS`) for all 26 keys.
+
+    Entry k is the share in the candidate decoded with key k; each per-key
+    picker is a precomputed `operator.itemgetter`, so no index math runs here.
+    """
+    return [sum(pick(counts)) / N for pick in pickers]
+
+
+def _quantize_chi2(chi2: float) -> Decimal:
+    """Convert a float χ² to the 6 dp `Decimal` exposed by `DecryptionResult`."""
+    return Decimal(repr(chi2)).quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP)
+
+
 def _blend_scores(
     etaoin_score: float, vowel_score: float, keyword_score: float
 ) -> float:
@@ -291,6 +400,11 @@ def compute_keyword_hits(tokens: Iterable[str]) -> float:
                 seen.add(token)
                 distinct += 1
 
+    return _keyword_score(hits, distinct)
+
+
+def _keyword_score(hits: int, distinct: int) -> float:
+    """Saturating keyword score from hit and distinct-keyword counts, in [0, 1]."""
     if hits == 0:
         return 0.0
 
@@ -302,11 +416,67 @@ def compute_keyword_hits(tokens: Iterable[str]) -> float:
     return round(clamp_01(score), 6)
 
 
+def _keyword_hits_all_shifts(tokens: Iterable[str]) -> list[float]:
+    """`compute_keyword_hits()` of the tokens decoded with each of the 26 keys.
+
+    One pass over the (already lower-cased) ciphertext tokens: a token can only
+    decode to keyword w if their shift signatures match, and then only under
+    key (w[0] − token[0]) % 26, so no token is ever translated.
+    """
+    hits = [0] * 26
+    seen: list[set[str]] = [set() for _ in range(26)]
+
+    for token in tokens:
+        # keywords are short and apostrophe-free
+        if len(token) > _MAX_KEYWORD_LEN or not token.isalpha():
+            continue
+        first = ord(token[0])
+        sig = tuple((ord(c) - first) % 26 for c in token)
+        for kw in _KEYWORD_SIGNATURES.get(sig, ()):
+            key = (ord(kw[0]) - first) % 26
+            hits[key] += 1
+            seen[key].add(kw)
+
+    return [_keyword_score(h, len(s)) for h, s in zip(hits, seen)]
+
+
+def _key_histograms(msg: str, counts: Sequence[int]) -> Optional[list[tuple[int, ...]]]:
+    """Per-key ciphertext histograms when not every counted letter rotates.
+
+    `str.upper()` turns some non-ASCII characters into ASCII letters ("ß" →
+    "SS", "ﬁ" → "FI"). Decoding leaves those characters alone, so their
+    letters stay in their plaintext slots while the ASCII counts rotate. Entry
+    k is key k's histogram in cipher-slot order, ready for its row/picker.
+    Returns None when every counted letter is ASCII (plain rotation applies).
+    """
+    if msg.isascii():
+        return None
+    rotating = _letter_counts(msg.encode("ascii", "ignore").decode("ascii"))
+    fixed = tuple(map(operator.sub, counts, rotating))
+    if not any(fixed):
+        return None
+    # cipher slot i under key k decodes to plaintext slot (i + k) % 26
+    return [
+        tuple(map(operator.add, rotating, fixed[k:] + fixed[:k])) for k in range(26)
+    ]
+
+
+@functools.lru_cache(maxsize=64)
+def _letter_counts(msg: str) -> tuple[int, ...]:
+    """Count each letter of msg (case-insensitive) as a 26-slot tuple, A..Z.
+
+    The text is upper-cased exactly once. Memoized (immutable result), so
+    repeated `compute_letter_frequencies()` calls on the same text are cheap.
+    """
+    upper = msg.upper()
+    return tuple(upper.count(ltr) for ltr in ALPHABET)
+
+
 def compute_letter_frequencies(msg: str) -> dict[str, Decimal]:
     """Calculate observed frequencies in msg of all 26 letters."""
     if not msg.strip():
         return cast(dict[str, Decimal], {})
-    return {ltr: Decimal(msg.upper().count(ltr)) for ltr in ALPHABET}
+    return {ltr: Decimal(c) for ltr, c in zip(ALPHABET, _letter_counts(msg))}
 
 
 def compute_vowel_ratio(vowels: Mapping[str, Decimal], N: Decimal) -> float:
@@ -319,8 +489,12 @@ def compute_vowel_ratio(vowels: Mapping[str, Decimal], N: Decimal) -> float:
         return 0.0
 
     ratio = float(sum(vowels.values())) / float(N)
-    score = math.exp(-((ratio - CENTER) ** 2) / (2 * SIGMA**2))
-    return round(score, 6)
+    return _vowel_score(ratio)
+
+
+def _vowel_score(ratio: float) -> float:
+    """Gaussian score of a vowel share (see `compute_vowel_ratio()`), to 6 dp."""
+    return round(math.exp(-((ratio - CENTER) ** 2) / _TWO_SIGMA_SQ), 6)
 
 
 def compute_evidence(margin: float) -> float:
@@ -342,7 +516,7 @@ def compute_evidence(margin: float) -> float:
 
 
 def break_tie_between_candidates(
-    candidates: Sequence[tuple[int, Decimal, float, float, float]],
+    candidates: Sequence[tuple[int, Decimal | float, float, float, float]],
 ) -> int:
     """Break ties among near-equal χ² candidates using a blended heuristic
     (ETAOIN, vowel score, keyword score). Returns the winning key.
@@ -357,58 +531,141 @@ def is_int_but_not_bool(x: Any) -> TypeGuard[int]:
     return isinstance(x, int) and not isinstance(x, bool)
 
 
+def _translate(msg: str, k: int) -> str:
+    """Shift the ASCII letters of `msg` right by `k` (0..25).
+
+    ASCII text goes through `bytes.translate` (a plain byte LUT); anything else
+    falls back to `str.translate`. Key 0 is the identity and returns `msg` as is.
+    """
+    if k == 0:
+        return msg
+    if msg.isascii():
+        return msg.encode("ascii").translate(_BYTE_TABLES[k]).decode("ascii")
+    return msg.translate(_STR_TABLES[k])
+
+
 def shift(c: str, offset: int) -> str:
     """Shift ASCII letters by `offset`, preserving case; pass everything else through."""
-    upper = c.upper()
-    if upper not in ALPHABET:
-        return c
     # Normalize offset once so negatives or big numbers still work
     k = offset % 26
-    idx = (ALPHABET.index(upper) + k) % 26
-    ch = ALPHABET[idx]
-    return ch.lower() if c.islower() else ch
+    if len(c) == 1 and c < "\x80":
+        return _CHAR_LUTS[k][ord(c)]
+    return c.translate(_STR_TABLES[k])
 
 
 # --- core transformers ---
 def decode_caesar_cipher(msg: str, offset: int) -> str:
     """Decode by shifting letters to the right by `offset`."""
-    return "".join(shift(c, offset) for c in msg)
+    return _translate(msg, offset % 26)
 
 
 def encode_caesar_cipher(msg: str, offset: int) -> str:
     """Encode by shifting letters to the left by `offset`."""
-    return "".join(shift(c, -offset) for c in msg)
+    return _translate(msg, -offset % 26)
+
+
+def decode_caesar_cipher_bytes(data: bytes, offset: int) -> bytes:
+    """Decode ASCII `data` by shifting letters to the right by `offset`.
+
+    Byte-level counterpart of `decode_caesar_cipher()`; non-letter bytes pass through.
+    """
+    k = offset % 26
+    return data if k == 0 else data.translate(_BYTE_TABLES[k])
 
 
 # --- io wrapper ---
-def read_received_messages(filename: str) -> list[Message]:
+def iter_received_messages(filename: str) -> Iterator[Message]:
     """
-    Read messages from package resources; tolerate dict or list inputs, and
-    normalize to a list of Message-like dicts.
+    Yield messages from package resources one at a time; tolerate dict or list
+    inputs, and normalize each entry to a Message-like dict.
+
+    Dict entries are merged with their id lazily, so no normalized copy of the
+    whole mailbox is ever held. A missing or malformed file yields nothing.
     """
     try:
         path = resources.files(FILEPATH).joinpath(filename)
-        with path.open("r", encoding="utf-8") as f:
-            data: Any = json.load(f)
+        # one bytes read; json detects the UTF-8 encoding itself
+        data: Any = json.loads(path.read_bytes())
     except FileNotFoundError as e:
         print(f"File not found: {e}")
-        return []
+        return
     except json.JSONDecodeError as e:
         print(f"JSON decoding error: {e}")
-        return []
+        return
 
     if isinstance(data, dict):
-        # Promote to list with explicit id
-        normalized = [{"id": k, **v} for k, v in data.items()]
-        return cast(list[Message], normalized)
+        # Promote to message with explicit id
+        for k, v in data.items():
+            yield cast(Message, {"id": k, **v})
+        return
 
     if isinstance(data, list):
-        return cast(list[Message], data)
+        yield from cast(list[Message], data)
+        return
 
     raise TypeError("Expected dictionary or list of messages")
 
 
+def read_received_messages(filename: str) -> list[Message]:
+    """
+    Read messages from package resources; tolerate dict or list inputs, and
+    normalize to a list of Message-like dicts.
+    """
+    return list(iter_received_messages(filename))
+
+
 # --- brute force wrapper ---
+# four parallel 26-slot score columns: (χ², ETAOIN rate, vowel ratio, keyword hits)
+_ShiftScores = tuple[
+    tuple[float, ...], tuple[float, ...], tuple[float, ...], tuple[float, ...]
+]
+
+
+@functools.lru_cache(maxsize=1024)
+def _score_shifts(msg: str) -> Optional[_ShiftScores]:
+    """Score all 26 candidate keys for `msg` as parallel columns indexed by key.
+
+    Returns None when `msg` has no letters. Scoring is a pure function of the
+    text, so results are memoized per process (repeat and duplicate messages
+    are scored once); the columns are immutable, so sharing is safe.
+    """
+    # Count the ciphertext once; every candidate histogram is a rotation of it,
+    # except for letters that non-ASCII characters upper-case into.
+    counts = _letter_counts(msg)
+    N = sum(counts)
+
+    if N == 0:
+        return None
+
+    hists = _key_histograms(msg, counts)
+    if hists is None:
+        chi2s = _chi_squared_all_shifts(counts, N)
+        etaoin_shares = _letter_share_all_shifts(counts, _ETAOIN_PICKERS, N)
+        vowel_shares = _letter_share_all_shifts(counts, _VOWEL_PICKERS, N)
+    else:
+        chi2s = _chi_squared_per_key(hists, N)
+        etaoin_shares = [sum(pick(h)) / N for pick, h in zip(_ETAOIN_PICKERS, hists)]
+        vowel_shares = [sum(pick(h)) / N for pick, h in zip(_VOWEL_PICKERS, hists)]
+
+    etaoin_rates = [round(r, 6) for r in etaoin_shares]
+    # `_vowel_score()` inlined over the 26 shares, with math.exp bound locally
+    exp = math.exp
+    vowel_scores = [
+        round(exp(-((r - CENTER) ** 2) / _TWO_SIGMA_SQ), 6) for r in vowel_shares
+    ]
+    # Shifting never changes which characters are letters, so the ciphertext
+    # tokens are the candidate tokens; they are scored for all keys in one pass.
+    lowered = msg.lower() if msg.isascii() else msg.translate(_ASCII_LOWER)
+    keyword_scores = _keyword_hits_all_shifts(_TOKEN_RE.findall(lowered))
+
+    return (
+        tuple(chi2s),
+        tuple(etaoin_rates),
+        tuple(vowel_scores),
+        tuple(keyword_scores),
+    )
+
+
 @overload
 def brute_force_offset(
     msg: str, return_all: Literal[True], verbose: bool = False
@@ -426,9 +683,11 @@ def brute_force_offset(
     Brute-force the Caesar shift for `msg` by scoring all 26 candidates.
 
     Strategy:
-      1) For each shift k in [0..25], decode and compute:
+      1) Count the ciphertext letters once. For each shift k in [0..25], rotate
+         that histogram by k (a Caesar shift only permutes letters) and compute:
          - χ² (chi-squared) between observed letter counts and the expected
-           English distribution (E table), using Decimal for precision.
+           English distribution (E table), in float; only the reported top-3
+           values are converted back to 6 dp `Decimal`.
          - ETAOIN rate = (E+T+A+O+I+N)/N as a cheap “English-likeness” tie-breaker.
       2) Pick the smallest χ². If runners-up are within 10% of the best χ²,
          break ties using a blended heuristic (ETAOIN score, vowel score, and keyword score).
@@ -440,65 +699,54 @@ def brute_force_offset(
       - If the message contains no alphabetic characters (N == 0), this function
         returns -1 (low confidence). Future versions may surface an explicit
         confidence score or top-N candidates.
+      - Candidate scores are memoized per process (see `_score_shifts()`), so
+        repeated calls on the same text skip the scoring pass.
     """
     offset = CERTAINTY.low
-    N0 = sum(compute_letter_frequencies(msg).values(), ZERO)
+    scores = _score_shifts(msg)
 
-    if N0 == ZERO:
+    if scores is None:
         return offset
 
-    # score → {key: (χ², ETAOIN rate, vowel ratio, keyword hits)}
-    scores: dict[int, tuple[Decimal, float, float, float]] = {}
-
-    for key in range(26):
-        decoded = decode_caesar_cipher(msg, key)
-        tokenized = re.findall(r"[A-Za-z']+", decoded)
-        observed = compute_letter_frequencies(decoded)
-        etaoin = {ltr: observed[ltr] for ltr in ETAOIN}
-        vowels = {ltr: observed[ltr] for ltr in VOWELS}
-        N = sum(observed.values(), Decimal("0"))
-        scores[key] = (
-            calc_chi_squared(observed, N),
-            compute_etaoin_rate(etaoin, N),
-            compute_vowel_ratio(vowels, N),
-            compute_keyword_hits(tokenized),
-        )
+    # column[key] for χ², ETAOIN rate, vowel ratio, keyword hits
+    chi2s, etas, vowels, keywords = scores
 
-        if verbose:
+    if verbose:
+        for key, (chi2, eta, vow, kw) in enumerate(zip(*scores)):
             print(
-                f"[k={key:02d}] chi2={scores[key][0]:.6f} eta={scores[key][1]:.3f} "
-                f"vow={scores[key][2]:.3f} kw={scores[key][3]:.3f}"
+                f"[k={key:02d}] chi2={chi2:.6f} eta={eta:.3f} "
+                f"vow={vow:.3f} kw={kw:.3f}"
             )
 
     # Rank top three scores by:
     #   1) χ² ascending
     #   2) ETAOIN descending
     #   3) key ascending
-    top3_keys = heapq.nsmallest(
-        3, scores, key=lambda k: (scores[k][0], -scores[k][1], k)
-    )
+    # (rank tuples compare natively, so no per-key key= callback is needed)
+    top3_keys = [
+        k
+        for _, _, k in heapq.nsmallest(
+            3, [(chi2, -eta, k) for k, (chi2, eta) in enumerate(zip(chi2s, etas))]
+        )
+    ]
 
-    best_k, second_k, third_k = top3_keys
-    best_chi2, best_eta, _, _ = scores[best_k]
-    second_chi2, _, _, _ = scores[second_k]
-    third_chi2, _, _, _ = scores[third_k]
-    threshold: Decimal = best_chi2 * Decimal("0.1")
+    best_k, second_k = top3_keys[:2]
+    best_chi2, best_eta = chi2s[best_k], etas[best_k]
+    second_chi2 = chi2s[second_k]
+    threshold = best_chi2 * 0.1
 
-    tiny = Decimal("1e-9")
-    margin = float((second_chi2 - best_chi2) / max(second_chi2, tiny))
+    tiny = 1e-9
+    margin = (second_chi2 - best_chi2) / max(second_chi2, tiny)
     evidence = compute_evidence(margin)  # 0..1
     etaoin_norm = best_eta
     confidence = 0.6 * evidence + 0.4 * etaoin_norm
 
-    if abs(best_chi2 - second_chi2) < threshold:
-        candidates = [
-            (k, scores[k][0], scores[k][1], scores[k][2], scores[k][3])
-            for k in top3_keys
-        ]
-        if abs(best_chi2 - third_chi2) < threshold:
-            offset = break_tie_between_candidates(candidates)
-        else:
-            offset = break_tie_between_candidates(candidates[:2])
+    # Runners-up within 10% of the best χ² (already sorted) join the tie-break
+    tied = [best_k] + [k for k in top3_keys[1:] if chi2s[k] - best_chi2 < threshold]
+    if len(tied) > 1:
+        offset = break_tie_between_candidates(
+            [(k, chi2s[k], etas[k], vowels[k], keywords[k]) for k in tied]
+        )
     else:
         offset = best_k
 
@@ -506,13 +754,11 @@ def brute_force_offset(
         return [
             DecryptionResult(
                 k,  # key
-                float(
-                    0.6 * compute_evidence(margin) + 0.4 * float(scores[k][1])
-                ),  # confidence level
-                scores[k][0],  # χ²
-                scores[k][1],  # ETAOIN rate
-                scores[k][2],  # vowel ratio
-                scores[k][3],  # keyword hits
+                0.6 * evidence + 0.4 * etas[k],  # confidence level
+                _quantize_chi2(chi2s[k]),  # χ²
+                etas[k],  # ETAOIN rate
+                vowels[k],  # vowel ratio
+                keywords[k],  # keyword hits
             )
             for k in top3_keys
         ]
@@ -526,6 +772,23 @@ def brute_force_offset(
     return offset
 
 
+def brute_force_offsets(texts: Sequence[str]) -> list[int]:
+    """Brute-force the Caesar shift of each text; results are in input order.
+
+    Each text is independent and the work is CPU-bound, so batches totalling at
+    least `_PARALLEL_MIN_CHARS` characters are spread across processes
+    (sidestepping the GIL), one worker per text at most; smaller batches run
+    inline.
+    """
+    workers = min(os.cpu_count() or 1, len(texts))
+    if workers < 2 or sum(map(len, texts)) < _PARALLEL_MIN_CHARS:
+        return [brute_force_offset(t) for t in texts]
+
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        chunksize = max(1, len(texts) // (4 * workers))
+        return list(ex.map(brute_force_offset, texts, chunksize=chunksize))
+
+
 # --- decode wrapper (with safety) ---
 def try_decode(text: str, meta: Mapping[str, Any]) -> str:
     """
@@ -577,6 +840,16 @@ def main() -> None:  # pragma: no cover
     messages = read_received_messages("recd_msgs.json")
     print(f"You have {len(messages)} new message{'s' if len(messages)!=1 else ''}.")
 
+    # Recover every unknown key up front so the brute force can run in parallel
+    unknown = [
+        i
+        for i, msg in enumerate(messages, start=1)
+        if bool(msg["meta"].get("encoded", False)) and msg["meta"].get("offset") is None
+    ]
+    bruted_keys = dict(
+        zip(unknown, brute_force_offsets([messages[i - 1]["text"] for i in unknown]))
+    )
+
     for i, msg in enumerate(messages, start=1):
         meta: Meta = msg["meta"]
         name = meta.get("name") or "Unknown"
@@ -593,7 +866,7 @@ def main() -> None:  # pragma: no cover
             )
             if offset is None:
                 additional_details += "Attempting to determine the key ... "
-                bruted_key: int = brute_force_offset(msg["text"])
+                bruted_key = bruted_keys[i]
 
                 if bruted_key >= 0:
                     meta["offset"] = bruted_key
@@ -611,7 +884,7 @@ def main() -> None:  # pragma: no cover
             f"It is {status}.{additional_details if additional_details is not None else '> '}"
             f"{'The message is as follows:' if known_key else 'Unable to decrypt message.'}\n"
             f"---\n"
-            f"{textwrap.fill(body, width=72)}\n"
+            f"{_WRAPPER.fill(body)}\n"
             f"---\n"
         )
         print(message)